@@ -4,18 +4,74 @@ import plotly.express as px
 import plotly.graph_objects as go
 import plotly.figure_factory as ff
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import io
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
 import sqlite3
 import os
 import logging
+import threading
+import uuid
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 try:
     import openpyxl
 except ImportError:
     st.warning("⚠️ openpyxl not installed. Excel export will not be available. Install with: pip install openpyxl")
     openpyxl = None
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library parser when orjson is unavailable
+    orjson = None
+
+# JSON helpers: use orjson when installed, otherwise the standard library
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj)
+
+def json_loads(data: Any) -> Any:
+    """
+    Parse JSON from a str or bytes value
+    """
+    # orjson's JSONDecodeError subclasses json's, so callers catch either
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# Rows formatted per write when serializing CSV exports
+CSV_EXPORT_CHUNK_SIZE = 50_000
+
+def dataframe_to_csv(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame as UTF-8 CSV without an index
+    """
+    # Writing encoded chunks into a byte buffer avoids holding the whole CSV
+    # as a str and again as its encoded bytes
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding='utf-8', chunksize=CSV_EXPORT_CHUNK_SIZE)
+    return buffer.getvalue()
+
+def dataframe_to_json(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame as an indented JSON array of records
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                df.to_dict(orient='records'),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            # Values orjson cannot encode (e.g. pd.NA) go through pandas instead
+            pass
+    return df.to_json(orient='records', indent=2).encode()
 
 # Configure logging
 def setup_logging():
@@ -68,22 +124,26 @@ if 'selected_filter' not in st.session_state:
 if 'processing_errors' not in st.session_state:
     st.session_state.processing_errors = []
 
-# Initialize download button counter for unique keys
-if 'download_button_counter' not in st.session_state:
-    st.session_state.download_button_counter = 0
+# Reset download button counter on every run so keys are unique within a run
+# and identical across reruns
+st.session_state.download_button_counter = 0
+
+def set_processed_data(df: pd.DataFrame):
+    """Store the application data for this session under a new version token"""
+    st.session_state.processed_data = df
+    # Lets cached helpers key on the data without hashing it
+    st.session_state.processed_data_version = uuid.uuid4().hex
+    st.session_state.data_loaded = True
 
 def get_unique_download_key(prefix: str) -> str:
     """Generate a unique key for download buttons"""
-    import random
     st.session_state.download_button_counter += 1
-    # Include current page context, counter, timestamp, and random number for absolute uniqueness
+    # Page context and the per-run counter are enough for uniqueness
     page_context = getattr(st.session_state, 'current_page', 'default')
-    timestamp = datetime.now().strftime('%H%M%S%f')
-    random_id = random.randint(10000, 99999)
-    return f"{page_context}_{prefix}_{st.session_state.download_button_counter}_{timestamp}_{random_id}"
+    return f"{page_context}_{prefix}_{st.session_state.download_button_counter}"
 
 # Custom CSS for better styling
-st.markdown("""
+APP_CSS = """
 <style>
     .main-header {
         font-size: 2.8rem;
@@ -152,7 +212,45 @@ st.markdown("""
         margin-top: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Emitted on every run: Streamlit drops elements that a rerun does not
+# re-emit, so guarding this behind session state would lose the styling
+st.markdown(APP_CSS, unsafe_allow_html=True)
+
+# Seconds between checks on a pending background auto-save
+AUTO_SAVE_POLL_SECONDS = 1
+
+@st.fragment(run_every=AUTO_SAVE_POLL_SECONDS)
+def poll_auto_save():
+    """
+    Show the pending auto-save banner and rerun the app once the save finishes
+    """
+    future = st.session_state.get('auto_save_future')
+    if future is None or future.done():
+        # The full rerun reports the outcome and stops rendering this fragment
+        st.rerun()
+    st.info("💾 Saving data to database in the background...")
+
+def show_auto_save_status():
+    """
+    Report the background auto-save started after an upload
+    """
+    future = st.session_state.get('auto_save_future')
+    if future is None:
+        return
+    
+    if not future.done():
+        poll_auto_save()
+        return
+    
+    del st.session_state.auto_save_future
+    try:
+        future.result()
+        st.success("📊 Data automatically saved to database")
+    except Exception as e:
+        logger.error(f"Error saving to database: {str(e)}")
+        st.warning("⚠️ Failed to save data to database")
 
 def show_error_notification():
     """Show error notification icon with expandable details"""
@@ -199,12 +297,15 @@ def create_navigation_bar():
     
     st.markdown("---")
 
-def load_and_validate_json(uploaded_file) -> Dict[str, Any]:
+# Top-level fields every instance file must provide
+REQUIRED_INSTANCE_FIELDS = ('instance_id', 'instance_name', 'applications')
+
+def load_and_validate_json(content: bytes) -> Dict[str, Any]:
     """
     Load and validate JSON file structure.
     
     Args:
-        uploaded_file: Streamlit uploaded file object
+        content: Raw bytes of an uploaded JSON file
         
     Returns:
         Dict containing the parsed JSON data
@@ -213,15 +314,13 @@ def load_and_validate_json(uploaded_file) -> Dict[str, Any]:
         ValueError: If JSON structure is invalid
     """
     try:
-        content = uploaded_file.read()
         if len(content) == 0:
             raise ValueError("File is empty")
             
-        data = json.loads(content)
+        data = json_loads(content)
         
         # Basic validation
-        required_fields = ['instance_id', 'instance_name', 'applications']
-        missing_fields = [field for field in required_fields if field not in data]
+        missing_fields = [field for field in REQUIRED_INSTANCE_FIELDS if field not in data]
         if missing_fields:
             raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
         
@@ -251,52 +350,77 @@ def load_and_validate_json(uploaded_file) -> Dict[str, Any]:
     except Exception as e:
         raise ValueError(f"Error processing file: {str(e)}")
 
+# Column order of the DataFrame produced from uploaded instance files
+APPLICATION_COLUMNS = (
+    'instance_id', 'instance_name', 'script_version', 'app_name', 'app_type',
+    'app_status', 'app_image', 'ports', 'pids', 'process_name', 'container_id'
+)
+
+# Low-cardinality columns stored as categoricals for cheaper grouping and filtering
+CATEGORICAL_COLUMNS = (
+    'instance_id', 'instance_name', 'script_version', 'app_type', 'app_status', 'process_name'
+)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def extract_application_columns(content: bytes) -> Dict[str, List[Any]]:
+    """
+    Validate a single instance file and extract its application columns.
+    
+    Cached on the file content, so re-uploading an unchanged file skips
+    parsing and validation even when the overall file set differs.
+    
+    Args:
+        content: Raw bytes of an uploaded JSON file
+        
+    Returns:
+        Dict mapping each name in APPLICATION_COLUMNS to a list of values
+        
+    Raises:
+        ValueError: If JSON structure is invalid
+    """
+    data = load_and_validate_json(content)
+    
+    # Extract instance information
+    instance_id = data.get('instance_id', 'Unknown')
+    instance_name = data.get('instance_name', 'Unknown')
+    script_version = data.get('script_version', 'Unknown')
+    
+    # Process applications
+    applications = data.get('applications', [])
+    app_count = len(applications)
+    
+    return {
+        'instance_id': [instance_id] * app_count,
+        'instance_name': [instance_name] * app_count,
+        'script_version': [script_version] * app_count,
+        'app_name': [app.get('name', 'Unknown') for app in applications],
+        'app_type': [app.get('type', 'Unknown') for app in applications],
+        'app_status': [app.get('status', 'Unknown') for app in applications],
+        'app_image': [app.get('image', '') for app in applications],
+        'ports': [', '.join(map(str, app.get('ports', []))) for app in applications],
+        'pids': [', '.join(map(str, app.get('pids', []))) for app in applications],
+        'process_name': [app.get('process_name', '') for app in applications],
+        'container_id': [app.get('container_id', '') for app in applications]
+    }
+
 @st.cache_data(ttl=3600)  # Cache for 1 hour since data is static
 def process_instance_data(uploaded_files):
     """
     Process multiple uploaded files and return a combined pandas DataFrame with caching
     """
-    all_dataframes = []
+    columns = {col: [] for col in APPLICATION_COLUMNS}
     
     for uploaded_file in uploaded_files:
         try:
-            # Load and validate JSON
-            data = load_and_validate_json(uploaded_file)
-            
-            # Extract instance information
-            instance_id = data.get('instance_id', 'Unknown')
-            instance_name = data.get('instance_name', 'Unknown')
-            script_version = data.get('script_version', 'Unknown')
-            
-            # Process applications
-            applications = data.get('applications', [])
-            
-            if not applications:
-                st.session_state.processing_errors.append(
-                    f"Error processing {uploaded_file.name}: Error processing file: 'applications' list is empty"
-                )
-                continue
+            # Skip empty uploads before materialising their content
+            if uploaded_file.size == 0:
+                raise ValueError("Error processing file: File is empty")
             
-            app_data = []
-            for app in applications:
-                app_info = {
-                    'instance_id': instance_id,
-                    'instance_name': instance_name,
-                    'script_version': script_version,
-                    'app_name': app.get('name', 'Unknown'),
-                    'app_type': app.get('type', 'Unknown'),
-                    'app_status': app.get('status', 'Unknown'),
-                    'app_image': app.get('image', ''),
-                    'ports': ', '.join(map(str, app.get('ports', []))),
-                    'pids': ', '.join(map(str, app.get('pids', []))),
-                    'process_name': app.get('process_name', ''),
-                    'container_id': app.get('container_id', '')
-                }
-                app_data.append(app_info)
-            
-            if app_data:
-                df = pd.DataFrame(app_data)
-                all_dataframes.append(df)
+            # Load, validate and extract columns (cached per file content).
+            # getvalue() returns the whole buffer regardless of the read position.
+            file_columns = extract_application_columns(uploaded_file.getvalue())
+            for col, values in file_columns.items():
+                columns[col].extend(values)
                 
         except Exception as e:
             st.session_state.processing_errors.append(
@@ -304,9 +428,9 @@ def process_instance_data(uploaded_files):
             )
             continue
     
-    # Combine all dataframes
-    if all_dataframes:
-        return pd.concat(all_dataframes, ignore_index=True)
+    # Build the combined DataFrame in a single construction
+    if columns['app_name']:
+        return pd.DataFrame(columns).astype({col: 'category' for col in CATEGORICAL_COLUMNS})
     else:
         return pd.DataFrame()
 
@@ -320,20 +444,172 @@ def create_summary_metrics(df: pd.DataFrame) -> Dict[str, Any]:
     Returns:
         Dictionary containing summary metrics
     """
-    # Calculate port statistics
-    all_ports = []
-    for ports_str in df['ports'].dropna():
-        if ports_str:
-            all_ports.extend([p.strip() for p in str(ports_str).split(',') if p.strip()])
+    total_instances = df['instance_id'].nunique()
+    app_type_counts = df['app_type'].value_counts()
     
     return {
-        'total_instances': df['instance_id'].nunique(),
+        'total_instances': total_instances,
         'total_applications': len(df),
-        'unique_app_types': df['app_type'].nunique(),
-        'avg_apps_per_instance': round(len(df) / df['instance_id'].nunique(), 1) if df['instance_id'].nunique() > 0 else 0,
-        'app_types': df['app_type'].value_counts().to_dict()
+        'unique_app_types': len(app_type_counts),
+        'avg_apps_per_instance': round(len(df) / total_instances, 1) if total_instances > 0 else 0,
+        'app_types': app_type_counts.to_dict()
+    }
+
+# Icons for application types, matched exactly first and then by substring
+APP_TYPE_ICONS = {
+    'docker': '🐳',
+    'systemd': '⚙️',
+    'service': '🔧',
+    'process': '⚡',
+    'container': '📦',
+    'daemon': '👹',
+    'application': '💻',
+    'web': '🌐',
+    'database': '🗄️',
+    'api': '🔌',
+    'server': '🖥️',
+    'nginx': '🌐',
+    'apache': '🌐',
+    'mysql': '🗄️',
+    'postgresql': '🐘',
+    'redis': '🔴',
+    'mongodb': '🍃'
+}
+
+def get_app_type_icon(app_type) -> str:
+    """Map an application type to its display icon"""
+    app_type = str(app_type).lower()
+    # Check for exact match first
+    if app_type in APP_TYPE_ICONS:
+        return APP_TYPE_ICONS[app_type]
+    # Check for partial matches
+    for key, icon in APP_TYPE_ICONS.items():
+        if key in app_type:
+            return icon
+    # Default icon for unknown types
+    return '📋'
+
+# Maximum number of instances plotted individually in per-instance bar charts
+MAX_CHART_INSTANCES = 50
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def compute_overview_aggregates(_df: pd.DataFrame, data_version: str) -> Dict[str, Any]:
+    """
+    Compute every aggregate used by the Application Overview page in one pass.
+    
+    Args:
+        _df: Processed DataFrame (not hashed)
+        data_version: Token identifying _df, see set_processed_data
+        
+    Returns:
+        Dictionary with the instance count, app type counts, per-instance
+        application counts, per-instance type diversity and the
+        instance/type distribution
+    """
+    by_instance = _df.groupby('instance_name', observed=True)
+    return {
+        'total_instances': _df['instance_id'].nunique(),
+        'app_type_counts': _df['app_type'].value_counts(),
+        'instance_app_counts': by_instance.size().reset_index(name='app_count'),
+        'instance_types': by_instance['app_type'].nunique().reset_index(name='type_diversity'),
+        'app_dist_data': _df.groupby(['instance_name', 'app_type'], observed=True).size().reset_index(name='count')
     }
 
+# Cached figure builders: each returns Figure.to_dict() so reruns with
+# unchanged inputs skip Plotly Express figure construction and validation
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_app_type_pie_figure(app_type_counts: pd.Series) -> Dict[str, Any]:
+    """Build the application type distribution pie chart"""
+    fig = px.pie(
+        values=app_type_counts.values,
+        names=app_type_counts.index,
+        title="Click on a segment to filter applications",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(showlegend=True, height=400)
+    return fig.to_dict()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_instance_bar_figure(instance_app_counts: pd.DataFrame, title: str) -> Dict[str, Any]:
+    """Build the applications per instance bar chart"""
+    fig = px.bar(
+        instance_app_counts,
+        x='instance_name',
+        y='app_count',
+        title=title,
+        color='app_count',
+        color_continuous_scale='Blues'
+    )
+    fig.update_layout(height=400, xaxis_tickangle=-45)
+    return fig.to_dict()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_architecture_bar_figure(app_type_counts: pd.Series) -> Dict[str, Any]:
+    """Build the application architecture distribution bar chart"""
+    fig = px.bar(
+        x=app_type_counts.index,
+        y=app_type_counts.values,
+        title="Application Architecture Distribution",
+        color=app_type_counts.values,
+        color_continuous_scale='Viridis'
+    )
+    fig.update_layout(height=300)
+    return fig.to_dict()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_instance_scatter_figure(instance_usage: pd.DataFrame) -> Dict[str, Any]:
+    """Build the instance diversity scatter plot"""
+    fig = px.scatter(
+        instance_usage,
+        x='instance_name',
+        y='type_diversity',
+        size='app_count',
+        title="Instance Diversity (Apps vs Types) - Click to view details",
+        hover_data=['type_diversity'],
+        render_mode='webgl'
+    )
+    fig.update_layout(height=300, xaxis_tickangle=-45)
+    return fig.to_dict()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_distribution_bar_figure(app_dist_data: pd.DataFrame) -> Dict[str, Any]:
+    """Build the stacked application count by instance and type bar chart"""
+    fig = px.bar(
+        app_dist_data,
+        x='instance_name',
+        y='count',
+        color='app_type',
+        title="Application Count by Instance and Type",
+        labels={'count': 'Number of Applications', 'instance_name': 'Instance'},
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig.update_layout(
+        height=300,
+        xaxis_tickangle=-45,
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig.to_dict()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_port_heatmap_figure(pivot_matrix: pd.DataFrame) -> Dict[str, Any]:
+    """Build the port usage heatmap from an instance x port count matrix"""
+    fig = px.imshow(
+        pivot_matrix.values,
+        labels=dict(x="Port", y="Instance", color="Usage Count"),
+        x=pivot_matrix.columns,
+        y=pivot_matrix.index,
+        color_continuous_scale='Viridis',
+        title="Port Usage Across Instances"
+    )
+    fig.update_layout(
+        height=max(400, len(pivot_matrix.index) * 50),
+        xaxis_title="Port Number",
+        yaxis_title="Instance Name"
+    )
+    return fig.to_dict()
+
 def create_application_overview_page(df: pd.DataFrame):
     """
     Create the main Application Overview page with interactive visualizations
@@ -346,11 +622,17 @@ def create_application_overview_page(df: pd.DataFrame):
         st.warning("No data available for visualization.")
         return
     
+    # Shared aggregates, cached across reruns and reused by the panels below
+    aggregates = compute_overview_aggregates(df, st.session_state.processed_data_version)
+    total_instances = aggregates['total_instances']
+    app_type_counts = aggregates['app_type_counts']
+    instance_app_counts = aggregates['instance_app_counts']
+    instance_types = aggregates['instance_types']
+    
     # Summary metrics row
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_instances = df['instance_id'].nunique()
         st.metric("Total Instances", total_instances)
     
     with col2:
@@ -358,8 +640,7 @@ def create_application_overview_page(df: pd.DataFrame):
         st.metric("Total Applications", total_apps)
     
     with col3:
-        app_types = df['app_type'].nunique()
-        st.metric("App Types", app_types)
+        st.metric("App Types", len(app_type_counts))
     
     with col4:
         avg_apps = round(total_apps / total_instances, 1) if total_instances > 0 else 0
@@ -383,7 +664,7 @@ def create_application_overview_page(df: pd.DataFrame):
     
     with action_col3:
         # Find most used app type for quick filter
-        most_used_app_type = df['app_type'].value_counts().index[0] if not df['app_type'].value_counts().empty else None
+        most_used_app_type = app_type_counts.index[0] if not app_type_counts.empty else None
         if most_used_app_type and st.button(f"🎯 View {most_used_app_type}", key="view_most_used_app_btn", help=f"Filter by {most_used_app_type} applications"):
             st.session_state.current_page = 'filtered_view'
             st.session_state.selected_filter = {'type': 'app_type', 'value': most_used_app_type}
@@ -391,7 +672,7 @@ def create_application_overview_page(df: pd.DataFrame):
     
     with action_col4:
         # Find instance with most apps for quick access
-        busiest_instance = df.groupby('instance_name').size().idxmax() if not df.empty else None
+        busiest_instance = instance_app_counts.loc[instance_app_counts['app_count'].idxmax(), 'instance_name']
         if busiest_instance and st.button(f"🏆 Busiest Instance", key="busiest_instance_btn", help=f"View {busiest_instance} (most applications)"):
             st.session_state.current_page = 'filtered_view'
             st.session_state.selected_filter = {'type': 'instance', 'value': busiest_instance}
@@ -404,59 +685,21 @@ def create_application_overview_page(df: pd.DataFrame):
     
     with col1:
         st.markdown("### 🎯 Application Types Distribution")
-        app_type_counts = df['app_type'].value_counts()
         
-        fig_pie = px.pie(
-            values=app_type_counts.values,
-            names=app_type_counts.index,
-            title="Click on a segment to filter applications",
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-        fig_pie.update_layout(showlegend=True, height=400)
+        fig_pie = go.Figure(build_app_type_pie_figure(app_type_counts))
         
         # Display pie chart (static - no real-time interaction)
         st.plotly_chart(fig_pie, width='stretch', key="app_type_pie")
         
         # Add manual filter buttons below chart
         st.markdown("**Filter by Application Type:**")
-        app_types = df['app_type'].value_counts().index.tolist()
-        
-        # Map application types to appropriate icons
-        def get_app_type_icon(app_type):
-            icon_map = {
-                'docker': '🐳',
-                'systemd': '⚙️',
-                'service': '🔧',
-                'process': '⚡',
-                'container': '📦',
-                'daemon': '👹',
-                'application': '💻',
-                'web': '🌐',
-                'database': '🗄️',
-                'api': '🔌',
-                'server': '🖥️',
-                'nginx': '🌐',
-                'apache': '🌐',
-                'mysql': '🗄️',
-                'postgresql': '🐘',
-                'redis': '🔴',
-                'mongodb': '🍃'
-            }
-            # Check for exact match first
-            if app_type.lower() in icon_map:
-                return icon_map[app_type.lower()]
-            # Check for partial matches
-            for key, icon in icon_map.items():
-                if key in app_type.lower():
-                    return icon
-            # Default icon for unknown types
-            return '📋'
+        app_types = app_type_counts.index.tolist()
         
+        filter_icons = app_type_counts.index[:4].map(get_app_type_icon)
         filter_cols = st.columns(min(len(app_types), 4))
         for i, app_type in enumerate(app_types[:4]):
             with filter_cols[i % 4]:
-                icon = get_app_type_icon(app_type)
+                icon = filter_icons[i]
                 if st.button(f"{icon} {app_type}", key=f"filter_app_{i}", help=f"Filter by {app_type}"):
                     st.session_state.current_page = 'filtered_view'
                     st.session_state.selected_filter = {'type': 'app_type', 'value': app_type}
@@ -464,17 +707,16 @@ def create_application_overview_page(df: pd.DataFrame):
     
     with col2:
         st.markdown("### 🏢 Applications per Instance")
-        instance_app_counts = df.groupby('instance_name').size().reset_index(name='app_count')
-        
-        fig_bar = px.bar(
-            instance_app_counts,
-            x='instance_name',
-            y='app_count',
-            title="Click on a bar to view instance details",
-            color='app_count',
-            color_continuous_scale='Blues'
-        )
-        fig_bar.update_layout(height=400, xaxis_tickangle=-45)
+        
+        # Large fleets are limited to the busiest instances to keep the chart responsive
+        if len(instance_app_counts) > MAX_CHART_INSTANCES:
+            bar_data = instance_app_counts.nlargest(MAX_CHART_INSTANCES, 'app_count')
+            bar_title = f"Top {MAX_CHART_INSTANCES} of {len(instance_app_counts)} instances by application count"
+        else:
+            bar_data = instance_app_counts
+            bar_title = "Click on a bar to view instance details"
+        
+        fig_bar = go.Figure(build_instance_bar_figure(bar_data, bar_title))
         
         # Display bar chart (static - no real-time interaction)
         st.plotly_chart(fig_bar, width='stretch', key="instance_bar")
@@ -499,15 +741,7 @@ def create_application_overview_page(df: pd.DataFrame):
         st.markdown("### 🏗️ Application Architecture Overview")
         if 'app_type' in df.columns:
             # Show application architecture distribution instead of status
-            arch_counts = df['app_type'].value_counts()
-            fig_arch = px.bar(
-                x=arch_counts.index,
-                y=arch_counts.values,
-                title="Application Architecture Distribution",
-                color=arch_counts.values,
-                color_continuous_scale='Viridis'
-            )
-            fig_arch.update_layout(height=300)
+            fig_arch = go.Figure(build_architecture_bar_figure(app_type_counts))
             
             # Display architecture chart
             st.plotly_chart(fig_arch, width='stretch', key="arch_bar")
@@ -516,17 +750,9 @@ def create_application_overview_page(df: pd.DataFrame):
     
     with col2:
         st.markdown("### 📈 Instance Utilization")
-        instance_types = df.groupby('instance_name')['app_type'].nunique().reset_index(name='type_diversity')
-        
-        fig_scatter = px.scatter(
-            instance_types,
-            x='instance_name',
-            y='type_diversity',
-            size=[instance_app_counts[instance_app_counts['instance_name'] == name]['app_count'].iloc[0] for name in instance_types['instance_name']],
-            title="Instance Diversity (Apps vs Types) - Click to view details",
-            hover_data=['type_diversity']
-        )
-        fig_scatter.update_layout(height=300, xaxis_tickangle=-45)
+        instance_usage = instance_types.merge(instance_app_counts, on='instance_name')
+        
+        fig_scatter = go.Figure(build_instance_scatter_figure(instance_usage))
         
         # Display scatter plot
         st.plotly_chart(fig_scatter, width='stretch', key="instance_scatter")
@@ -540,25 +766,11 @@ def create_application_overview_page(df: pd.DataFrame):
     with col1:
         st.markdown("#### 📊 Application Distribution by Instance")
         # Create application distribution visualization
-        app_dist_data = df.groupby(['instance_name', 'app_type']).size().reset_index(name='count')
+        app_dist_data = aggregates['app_dist_data']
         
         if not app_dist_data.empty:
             # Create stacked bar chart showing application distribution
-            fig_dist = px.bar(
-                app_dist_data,
-                x='instance_name',
-                y='count',
-                color='app_type',
-                title="Application Count by Instance and Type",
-                labels={'count': 'Number of Applications', 'instance_name': 'Instance'},
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            fig_dist.update_layout(
-                height=300,
-                xaxis_tickangle=-45,
-                showlegend=True,
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-            )
+            fig_dist = go.Figure(build_distribution_bar_figure(app_dist_data))
             
             st.plotly_chart(fig_dist, width='stretch', key="app_distribution")
         else:
@@ -599,6 +811,37 @@ def create_visualizations(df: pd.DataFrame, metrics: Dict[str, Any]):
 
 
 
+@st.cache_data(ttl=3600)
+def extract_port_usage(_df: pd.DataFrame, data_version: str) -> pd.DataFrame:
+    """
+    Explode the comma-separated ports column into one row per numeric port.
+    
+    Entries such as "8080:80" contribute their host port; anything else that
+    is not a plain port number is dropped.
+    
+    Args:
+        _df: Processed DataFrame (not hashed)
+        data_version: Token identifying _df, see set_processed_data
+        
+    Returns:
+        DataFrame with instance/application columns and an integer 'port' column
+    """
+    # Split and flatten with Arrow compute kernels, remembering the source row
+    # of every port token
+    ports_array = pa.array(_df['ports'], type=pa.string(), from_pandas=True)
+    if isinstance(ports_array, pa.ChunkedArray):
+        # Arrow-backed columns (e.g. loaded from the database) come back chunked
+        ports_array = ports_array.combine_chunks()
+    port_lists = pc.split_pattern(ports_array, pattern=',')
+    tokens = pc.utf8_trim_whitespace(pc.list_flatten(port_lists))
+    valid = pc.match_substring_regex(tokens, pattern=r'^\d{1,5}(?::|$)')
+    ports = pc.cast(pc.replace_substring_regex(pc.filter(tokens, valid), pattern=r':.*$', replacement=''), pa.int32())
+    source_rows = pc.filter(pc.list_parent_indices(port_lists), valid).to_numpy()
+    
+    port_df = _df[['instance_name', 'app_name', 'app_type', 'app_status']].iloc[source_rows].reset_index(drop=True)
+    port_df['port'] = ports.to_numpy()
+    return port_df
+
 def create_port_heatmap(df: pd.DataFrame):
     """
     Create heatmap visualization for port usage across instances.
@@ -613,55 +856,15 @@ def create_port_heatmap(df: pd.DataFrame):
         return
     
     # Extract port information
-    port_data = []
+    port_df = extract_port_usage(df, st.session_state.processed_data_version)
     
-    for idx, row in df.iterrows():
-        if pd.notna(row['ports']) and row['ports'] != 'N/A':
-            try:
-                # Handle different port formats
-                ports_str = str(row['ports'])
-                if ',' in ports_str:
-                    ports = [p.strip() for p in ports_str.split(',')]
-                elif ':' in ports_str:
-                    ports = [p.split(':')[0] for p in ports_str.split(',')]
-                else:
-                    ports = [ports_str]
-                
-                for port in ports:
-                    if port.isdigit():
-                        port_data.append({
-                            'instance': row['instance_name'],
-                            'port': int(port),
-                            'app_name': row['app_name'],
-                            'app_type': row['app_type'],
-                            'status': row['app_status']
-                        })
-            except:
-                continue
-    
-    if port_data:
-        port_df = pd.DataFrame(port_data)
-        
+    if not port_df.empty:
         # Create port usage matrix
-        port_matrix = port_df.groupby(['instance', 'port']).size().reset_index(name='count')
-        pivot_matrix = port_matrix.pivot(index='instance', columns='port', values='count').fillna(0)
+        pivot_matrix = pd.crosstab(port_df['instance_name'], port_df['port'])
         
         if not pivot_matrix.empty:
             # Create heatmap
-            fig = px.imshow(
-                pivot_matrix.values,
-                labels=dict(x="Port", y="Instance", color="Usage Count"),
-                x=pivot_matrix.columns,
-                y=pivot_matrix.index,
-                color_continuous_scale='Viridis',
-                title="Port Usage Across Instances"
-            )
-            
-            fig.update_layout(
-                height=max(400, len(pivot_matrix.index) * 50),
-                xaxis_title="Port Number",
-                yaxis_title="Instance Name"
-            )
+            fig = go.Figure(build_port_heatmap_figure(pivot_matrix))
             
             st.plotly_chart(fig, width='stretch')
             
@@ -685,7 +888,7 @@ def create_port_heatmap(df: pd.DataFrame):
             
             with col2:
                 st.subheader("🏢 Instance Overview")
-                instance_stats = df.groupby('instance_name').agg({
+                instance_stats = df.groupby('instance_name', observed=True).agg({
                     'app_type': 'nunique',
                     'app_name': 'count'
                 }).reset_index()
@@ -698,7 +901,8 @@ def create_port_heatmap(df: pd.DataFrame):
                     size='Total Apps',
                     hover_name='Instance',
                     title="Instance Complexity (App Types vs Total Apps)",
-                    labels={'App Types': 'Number of Different App Types', 'Total Apps': 'Total Applications'}
+                    labels={'App Types': 'Number of Different App Types', 'Total Apps': 'Total Applications'},
+                    render_mode='webgl'
                 )
                 fig_instance.update_layout(height=400)
                 st.plotly_chart(fig_instance, width='stretch')
@@ -707,6 +911,45 @@ def create_port_heatmap(df: pd.DataFrame):
     else:
         st.info("No valid port data found")
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_unique_values(_df: pd.DataFrame, data_version: str, column: str) -> tuple:
+    """Return the distinct values of a column in order of first appearance"""
+    return tuple(_df[column].unique())
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def filter_by_instance(_df: pd.DataFrame, data_version: str, instance_name: str) -> pd.DataFrame:
+    """Return the applications belonging to a single instance"""
+    return _df[_df['instance_name'] == instance_name].reset_index(drop=True)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def compute_instance_summary(_df: pd.DataFrame, data_version: str) -> pd.DataFrame:
+    """
+    Summarise applications per instance.
+    
+    Args:
+        _df: Processed DataFrame (not hashed)
+        data_version: Token identifying _df, see set_processed_data
+        
+    Returns:
+        DataFrame indexed by instance_name with total_apps, app_types and
+        instance_id columns
+    """
+    by_instance = _df.groupby('instance_name', observed=True)
+    total_apps = by_instance['app_name'].count()
+    # Distinct (instance, type) pairs counted per instance; avoids the slow
+    # SeriesGroupBy.nunique path
+    app_types = (
+        _df.groupby(['instance_name', 'app_type'], observed=True).size()
+        .groupby(level=0, observed=True).size()
+        .reindex(total_apps.index, fill_value=0)
+    )
+    return pd.DataFrame({
+        'total_apps': total_apps,
+        'app_types': app_types,
+        'instance_id': by_instance['instance_id'].first()
+    })
+
+@st.fragment
 def create_instance_details_page(df: pd.DataFrame):
     """
     Create comprehensive instance details page
@@ -720,7 +963,7 @@ def create_instance_details_page(df: pd.DataFrame):
         return
     
     # Instance selector
-    instances = df['instance_name'].unique()
+    instances = get_unique_values(df, st.session_state.processed_data_version, 'instance_name')
     
     # Check if instance was selected from overview page
     default_instance = 'All Instances'
@@ -741,7 +984,7 @@ def create_instance_details_page(df: pd.DataFrame):
     )
     
     if selected_instance != 'All Instances':
-        filtered_df = df[df['instance_name'] == selected_instance]
+        filtered_df = filter_by_instance(df, st.session_state.processed_data_version, selected_instance)
         st.markdown(f"### 📋 Analysis for: {selected_instance}")
         
         # Instance summary
@@ -765,6 +1008,8 @@ def create_instance_details_page(df: pd.DataFrame):
         with col1:
             st.markdown("#### Application Types in this Instance")
             app_types = filtered_df['app_type'].value_counts()
+            # Categorical counts include types absent from this instance
+            app_types = app_types[app_types > 0]
             fig_pie = px.pie(
                 values=app_types.values,
                 names=app_types.index,
@@ -819,15 +1064,7 @@ def create_instance_details_page(df: pd.DataFrame):
         st.markdown("### 📊 All Instances Overview")
         
         # Instance summary table
-        instance_summary = df.groupby('instance_name').agg({
-            'app_name': 'count',
-            'app_type': 'nunique',
-            'instance_id': 'first'
-        }).rename(columns={
-            'app_name': 'total_apps',
-            'app_type': 'app_types',
-            'instance_id': 'instance_id'
-        }).reset_index()
+        instance_summary = compute_instance_summary(df, st.session_state.processed_data_version).reset_index()
         
         st.markdown("#### Instance Summary")
         st.dataframe(instance_summary, width='stretch')
@@ -861,53 +1098,50 @@ def create_instance_details_page(df: pd.DataFrame):
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def create_filtered_view_page(df: pd.DataFrame):
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def export_csv(_df: pd.DataFrame, data_version: str, view: tuple) -> bytes:
     """
-    Create filtered view page based on user selection
+    CSV download payload for a view of the processed data, keyed by the data
+    version token and the filter inputs (view) that selected _df
+    """
+    return dataframe_to_csv(_df)
+
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def export_json(_df: pd.DataFrame, data_version: str, view: tuple) -> bytes:
+    """
+    JSON download payload for a view of the processed data, keyed by the data
+    version token and the filter inputs (view) that selected _df
+    """
+    return dataframe_to_json(_df)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def compute_filter_metrics(_df: pd.DataFrame, data_version: str, view: tuple) -> tuple:
+    """Return the application, instance and app type counts shown above a filtered table, keyed like export_csv"""
+    return len(_df), _df['instance_name'].nunique(), _df['app_type'].nunique()
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def compute_global_metrics(_df: pd.DataFrame, data_version: str) -> tuple:
+    """Return the filter metrics for the whole dataset, keyed by the data version token"""
+    return len(_df), _df['instance_name'].nunique(), _df['app_type'].nunique()
+
+@st.cache_data(ttl=3600, max_entries=2, show_spinner=False)
+def export_all_applications(_df: pd.DataFrame, data_version: str) -> tuple:
+    """Return the CSV and JSON payloads for the whole dataset, keyed by the data version token"""
+    return dataframe_to_csv(_df), dataframe_to_json(_df)
+
+def show_filtered_applications(filtered_df: pd.DataFrame, metrics: tuple, csv: bytes, json_data: bytes, file_suffix: str):
+    """
+    Render the metrics, table and export buttons of the filtered view
     """
-    st.markdown("<div class='page-container'>", unsafe_allow_html=True)
-    st.markdown("# 🔍 Filtered View")
-    
-    if df.empty:
-        st.warning("No data available for filtering.")
-        return
-    
-    # Check if there's a filter from navigation
-    if st.session_state.selected_filter:
-        filter_type = st.session_state.selected_filter.get('type')
-        filter_value = st.session_state.selected_filter.get('value')
-        
-        if filter_type == 'app_type':
-            filtered_df = df[df['app_type'] == filter_value]
-            st.markdown(f"### 🎯 Applications of type: **{filter_value}**")
-            
-        elif filter_type == 'instance':
-            filtered_df = df[df['instance_name'] == filter_value]
-            st.markdown(f"### 🏢 Applications in instance: **{filter_value}**")
-            
-        elif filter_type == 'app_status':
-            if 'app_status' in df.columns:
-                filtered_df = df[df['app_status'] == filter_value]
-                st.markdown(f"### 🔧 Applications with status: **{filter_value}**")
-            else:
-                filtered_df = df
-                st.warning(f"Status information not available. Showing all applications.")
-            
-        else:
-            filtered_df = df
-            st.markdown("### 📋 All Applications")
-    else:
-        filtered_df = df
-        st.markdown("### 📋 All Applications")
-    
     # Summary of filtered data
+    total_apps, instance_count, app_type_count = metrics
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Filtered Applications", len(filtered_df))
+        st.metric("Filtered Applications", total_apps)
     with col2:
-        st.metric("Instances Involved", filtered_df['instance_name'].nunique())
+        st.metric("Instances Involved", instance_count)
     with col3:
-        st.metric("Application Types", filtered_df['app_type'].nunique())
+        st.metric("Application Types", app_type_count)
     
     # Clear filter button
     if st.button("🔄 Clear Filter"):
@@ -924,33 +1158,108 @@ def create_filtered_view_page(df: pd.DataFrame):
         # Export options
         col1, col2 = st.columns(2)
         with col1:
-            csv = filtered_df.to_csv(index=False)
             st.download_button(
                 label="📥 Download as CSV",
                 data=csv,
-                file_name=f"filtered_applications_{filter_value if 'filter_value' in locals() else 'all'}.csv",
+                file_name=f"filtered_applications_{file_suffix}.csv",
                 mime="text/csv",
                 key=get_unique_download_key("filtered_view_csv")
             )
         
         with col2:
-            json_data = filtered_df.to_json(orient='records', indent=2)
             st.download_button(
                 label="📥 Download as JSON",
                 data=json_data,
-                file_name=f"filtered_applications_{filter_value if 'filter_value' in locals() else 'all'}.json",
+                file_name=f"filtered_applications_{file_suffix}.json",
                 mime="application/json",
                 key=get_unique_download_key("filtered_view_json")
             )
     else:
         st.warning("No applications match the current filter.")
+
+def create_filtered_view_page(df: pd.DataFrame):
+    """
+    Create filtered view page based on user selection
+    """
+    st.markdown("<div class='page-container'>", unsafe_allow_html=True)
+    st.markdown("# 🔍 Filtered View")
+    
+    if df.empty:
+        st.warning("No data available for filtering.")
+        return
+    
+    # No filter selected: totals and exports are cached per data version,
+    # so the full frame is neither scanned nor hashed on rerun
+    if not st.session_state.selected_filter:
+        st.markdown("### 📋 All Applications")
+        data_version = st.session_state.processed_data_version
+        csv, json_data = export_all_applications(df, data_version)
+        show_filtered_applications(df, compute_global_metrics(df, data_version), csv, json_data, 'all')
+        st.markdown("</div>", unsafe_allow_html=True)
+        return
+    
+    # Filter from navigation
+    filter_type = st.session_state.selected_filter.get('type')
+    filter_value = st.session_state.selected_filter.get('value')
+    
+    if filter_type == 'app_type':
+        filtered_df = df[df['app_type'] == filter_value]
+        st.markdown(f"### 🎯 Applications of type: **{filter_value}**")
+        
+    elif filter_type == 'instance':
+        filtered_df = df[df['instance_name'] == filter_value]
+        st.markdown(f"### 🏢 Applications in instance: **{filter_value}**")
+        
+    elif filter_type == 'app_status':
+        if 'app_status' in df.columns:
+            filtered_df = df[df['app_status'] == filter_value]
+            st.markdown(f"### 🔧 Applications with status: **{filter_value}**")
+        else:
+            filtered_df = df
+            st.warning(f"Status information not available. Showing all applications.")
+        
+    else:
+        filtered_df = df
+        st.markdown("### 📋 All Applications")
+    
+    data_version = st.session_state.processed_data_version
+    view = ('filtered_view', filter_type, filter_value)
+    show_filtered_applications(
+        filtered_df,
+        compute_filter_metrics(filtered_df, data_version, view),
+        export_csv(filtered_df, data_version, view),
+        export_json(filtered_df, data_version, view),
+        filter_value
+    )
     
     st.markdown("</div>", unsafe_allow_html=True)
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_search_text(_df: pd.DataFrame, data_version: str) -> pd.Series:
+    """
+    Join the searchable columns of each row into one lower-cased string.
+    
+    Fields are separated by a unit separator so a search term cannot match
+    across two columns.
+    
+    Args:
+        _df: Processed DataFrame (not hashed)
+        data_version: Token identifying _df, see set_processed_data
+        
+    Returns:
+        Arrow-backed string Series aligned with _df
+    """
+    fields = [_df[col].astype(object).fillna('').astype(str) for col in ('app_name', 'app_type', 'instance_name')]
+    search_text = fields[0] + '\x1f' + fields[1] + '\x1f' + fields[2]
+    return search_text.astype('string[pyarrow]').str.lower()
+
+@st.fragment
 def create_data_table_page(df: pd.DataFrame):
     """
     Create comprehensive data table page
     """
+    # Fragment reruns skip the module-level reset, keep download keys stable
+    st.session_state.download_button_counter = 0
     st.markdown("<div class='page-container'>", unsafe_allow_html=True)
     st.markdown("# 📋 Database Table")
     st.markdown("Complete application database with all details")
@@ -967,29 +1276,30 @@ def create_data_table_page(df: pd.DataFrame):
     
     with col2:
         if 'app_type' in df.columns:
-            app_type_filter = st.selectbox("Filter by App Type:", ['All'] + list(df['app_type'].unique()))
+            app_type_filter = st.selectbox("Filter by App Type:", ['All'] + list(get_unique_values(df, st.session_state.processed_data_version, 'app_type')))
         else:
             app_type_filter = 'All'
     
     with col3:
-        instance_filter = st.selectbox("Filter by Instance:", ['All'] + list(df['instance_name'].unique()))
+        instance_filter = st.selectbox("Filter by Instance:", ['All'] + list(get_unique_values(df, st.session_state.processed_data_version, 'instance_name')))
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters: combine the masks first and slice the frame once
+    mask = np.ones(len(df), dtype=bool)
     
     if search_term:
-        mask = (
-            filtered_df['app_name'].str.contains(search_term, case=False, na=False) |
-            filtered_df['app_type'].str.contains(search_term, case=False, na=False) |
-            filtered_df['instance_name'].str.contains(search_term, case=False, na=False)
-        )
-        filtered_df = filtered_df[mask]
+        # Plain substring match against the cached, lower-cased search text
+        matches = build_search_text(df, st.session_state.processed_data_version).str.contains(search_term.lower(), regex=False, na=False)
+        mask &= matches.to_numpy(dtype=bool, na_value=False)
     
     if app_type_filter != 'All':
-        filtered_df = filtered_df[filtered_df['app_type'] == app_type_filter]
+        mask &= (df['app_type'] == app_type_filter).to_numpy()
     
     if instance_filter != 'All':
-        filtered_df = filtered_df[filtered_df['instance_name'] == instance_filter]
+        mask &= (df['instance_name'] == instance_filter).to_numpy()
+    
+    filtered_df = df[mask]
+    # Filter inputs that selected filtered_df, used to key the cached exports
+    view = ('data_table', search_term.lower(), app_type_filter, instance_filter)
     
     # Display results count
     st.markdown(f"**Showing {len(filtered_df)} of {len(df)} applications**")
@@ -1003,7 +1313,7 @@ def create_data_table_page(df: pd.DataFrame):
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            csv = filtered_df.to_csv(index=False)
+            csv = export_csv(filtered_df, st.session_state.processed_data_version, view)
             st.download_button(
                 label="📥 Download as CSV",
                 data=csv,
@@ -1014,7 +1324,7 @@ def create_data_table_page(df: pd.DataFrame):
             )
         
         with col2:
-            json_data = filtered_df.to_json(orient='records', indent=2)
+            json_data = export_json(filtered_df, st.session_state.processed_data_version, view)
             st.download_button(
                 label="📥 Download as JSON",
                 data=json_data,
@@ -1038,6 +1348,32 @@ def create_data_table_page(df: pd.DataFrame):
     
     st.markdown("</div>", unsafe_allow_html=True)
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def compute_app_type_matrix(_df: pd.DataFrame, data_version: str) -> pd.DataFrame:
+    """
+    Count applications per (instance, app type) pair.
+    
+    Args:
+        _df: Processed DataFrame (not hashed)
+        data_version: Token identifying _df, see set_processed_data
+        
+    Returns:
+        DataFrame indexed by instance name with one column per application type
+    """
+    # Rows missing either key are left out, as groupby would
+    keys = _df[['instance_name', 'app_type']].dropna()
+    instances = keys['instance_name'].astype('category').cat.remove_unused_categories()
+    app_types = keys['app_type'].astype('category').cat.remove_unused_categories()
+    
+    # Count every (instance, type) cell in one bincount over the flattened
+    # category codes
+    n_instances = len(instances.cat.categories)
+    n_types = len(app_types.cat.categories)
+    cell_ids = instances.cat.codes.to_numpy(dtype=np.int64) * n_types + app_types.cat.codes.to_numpy(dtype=np.int64)
+    counts = np.bincount(cell_ids, minlength=n_instances * n_types).reshape(n_instances, n_types)
+    
+    return pd.DataFrame(counts, index=instances.cat.categories, columns=app_types.cat.categories)
+
 def create_instance_analysis(df: pd.DataFrame, metrics: Dict[str, Any]):
     """
     Create instance-focused analysis for management insights.
@@ -1053,13 +1389,7 @@ def create_instance_analysis(df: pd.DataFrame, metrics: Dict[str, Any]):
         return
     
     # Instance summary
-    instance_summary = df.groupby('instance_name').agg({
-        'app_name': 'count',
-        'app_type': 'nunique'
-    }).rename(columns={
-        'app_name': 'total_apps',
-        'app_type': 'app_types'
-    })
+    instance_summary = compute_instance_summary(df, st.session_state.processed_data_version)[['total_apps', 'app_types']]
     
     # Display instance summary table
     st.subheader("📊 Instance Summary")
@@ -1086,7 +1416,7 @@ def create_instance_analysis(df: pd.DataFrame, metrics: Dict[str, Any]):
     
     # Application type distribution across instances
     st.subheader("🔄 Application Types Across Instances")
-    app_type_matrix = df.groupby(['instance_name', 'app_type']).size().unstack(fill_value=0)
+    app_type_matrix = compute_app_type_matrix(df, st.session_state.processed_data_version)
     
     if not app_type_matrix.empty:
         fig_matrix = px.imshow(
@@ -1101,6 +1431,51 @@ def create_instance_analysis(df: pd.DataFrame, metrics: Dict[str, Any]):
         st.plotly_chart(fig_matrix, width='stretch')
 
 
+# Largest number of key combinations counted with a dense np.bincount; sparser
+# hierarchies fall back to sorting the composite keys
+MAX_BINCOUNT_CELLS = 1 << 22
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def compute_hierarchy_counts(_df: pd.DataFrame, data_version: str, path: tuple) -> pd.DataFrame:
+    """
+    Count rows per distinct combination of the given columns.
+    
+    Args:
+        _df: Processed DataFrame (not hashed)
+        data_version: Token identifying _df, see set_processed_data
+        path: Column names forming the hierarchy, outermost first
+        
+    Returns:
+        DataFrame with one row per observed combination and a 'count' column
+    """
+    # Rows missing any key are left out, as groupby would
+    keys = _df[list(path)].dropna()
+    factorized = [pd.factorize(keys[column], sort=True) for column in path]
+    
+    # Pack the per-column codes into a single composite integer key
+    composite = np.zeros(len(keys), dtype=np.int64)
+    n_cells = 1
+    for codes, uniques in factorized:
+        composite = composite * len(uniques) + codes
+        n_cells *= len(uniques)
+    
+    if n_cells <= MAX_BINCOUNT_CELLS:
+        counts = np.bincount(composite, minlength=n_cells)
+        cells = counts.nonzero()[0]
+        counts = counts[cells]
+    else:
+        cells, counts = np.unique(composite, return_counts=True)
+    
+    # Unpack the composite keys back into one column per level
+    columns = {}
+    for column, (codes, uniques) in reversed(list(zip(path, factorized))):
+        cells, level_codes = np.divmod(cells, len(uniques))
+        columns[column] = uniques.take(level_codes)
+    
+    hierarchy_data = pd.DataFrame({column: columns[column] for column in path})
+    hierarchy_data['count'] = counts
+    return hierarchy_data
+
 def create_treemap_visualization(df: pd.DataFrame):
     """
     Create treemap visualization for application hierarchy.
@@ -1117,7 +1492,7 @@ def create_treemap_visualization(df: pd.DataFrame):
     # Create hierarchy data with instance -> type -> application name
     if 'app_name' in df.columns:
         # Group by instance, type, and application name
-        hierarchy_data = df.groupby(['instance_name', 'app_type', 'app_name']).size().reset_index(name='count')
+        hierarchy_data = compute_hierarchy_counts(df, st.session_state.processed_data_version, ('instance_name', 'app_type', 'app_name'))
         
         if not hierarchy_data.empty:
             # Use app_type for color coding to distinguish different application types
@@ -1143,7 +1518,7 @@ def create_treemap_visualization(df: pd.DataFrame):
             st.info("No hierarchy data available")
     else:
         # Fallback to instance -> type if app_name is not available
-        hierarchy_data = df.groupby(['instance_name', 'app_type']).size().reset_index(name='count')
+        hierarchy_data = compute_hierarchy_counts(df, st.session_state.processed_data_version, ('instance_name', 'app_type'))
         
         if not hierarchy_data.empty:
             fig = px.treemap(
@@ -1185,75 +1560,149 @@ def get_database_path():
         os.makedirs(db_dir, exist_ok=True)
     return db_path
 
+# Pragmas applied once to the shared connection: WAL lets readers proceed
+# during writes and NORMAL sync avoids an fsync on every commit
+SQLITE_PRAGMAS = '''
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+'''
+
+@st.cache_resource
+def get_db_connection() -> sqlite3.Connection:
+    """
+    Open the SQLite connection shared by all sessions and reruns
+    """
+    conn = sqlite3.connect(get_database_path(), check_same_thread=False)
+    conn.executescript(SQLITE_PRAGMAS)
+    return conn
+
+@st.cache_resource
+def get_db_lock() -> threading.RLock:
+    """
+    Lock serialising use of the shared SQLite connection across sessions
+    """
+    return threading.RLock()
+
+@contextmanager
+def db_transaction():
+    """
+    Yield the shared connection inside a transaction that is committed on
+    success and rolled back on error
+    """
+    conn = get_db_connection()
+    with get_db_lock(), conn:
+        yield conn
+
+@st.cache_resource(show_spinner=False)
 def init_database():
     """
-    Initialize SQLite database for persistent storage
+    Initialize SQLite database for persistent storage and migrate older schemas.
+    Runs once per server process.
     """
     db_path = get_database_path()
     logger.info(f"Initializing database at: {db_path}")
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    # Create tables if they don't exist
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS application_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            instance_id TEXT,
-            instance_name TEXT,
-            app_name TEXT,
-            app_type TEXT,
-            app_status TEXT,
-            app_image TEXT,
-            ports TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS user_tables (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            table_name TEXT UNIQUE,
-            columns TEXT,
-            filters TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    conn.commit()
-    conn.close()
+    with db_transaction() as conn:
+        cursor = conn.cursor()
+        
+        # Create tables if they don't exist
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS application_data (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                instance_id TEXT,
+                instance_name TEXT,
+                app_name TEXT,
+                app_type TEXT,
+                app_status TEXT,
+                app_image TEXT,
+                ports TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS user_tables (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                table_name TEXT UNIQUE,
+                columns TEXT,
+                filters TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Older databases predate the custom_columns column
+        cursor.execute("PRAGMA table_info(user_tables)")
+        column_names = [col[1] for col in cursor.fetchall()]
+        if 'custom_columns' not in column_names:
+            cursor.execute('ALTER TABLE user_tables ADD COLUMN custom_columns TEXT DEFAULT "{}"')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS custom_tables (
+                table_name TEXT PRIMARY KEY,
+                table_data TEXT,
+                created_at TEXT,
+                updated_at TEXT,
+                table_rows BLOB
+            )
+        ''')
+        
+        # Older databases kept custom table rows inside the table_data JSON only
+        cursor.execute("PRAGMA table_info(custom_tables)")
+        column_names = [col[1] for col in cursor.fetchall()]
+        if 'table_rows' not in column_names:
+            cursor.execute('ALTER TABLE custom_tables ADD COLUMN table_rows BLOB')
     logger.info("Database initialized successfully")
 
-def save_data_to_db(df: pd.DataFrame):
+# Columns of application_data populated from the processed DataFrame
+DB_APPLICATION_COLUMNS = (
+    'instance_id', 'instance_name', 'app_name', 'app_type', 'app_status', 'app_image', 'ports'
+)
+
+# Rows converted and passed to each executemany call when saving
+DB_INSERT_CHUNK_SIZE = 10_000
+
+def write_application_data(df: pd.DataFrame):
     """
-    Save DataFrame to SQLite database
+    Replace the stored application data with the given DataFrame.
+    
+    Makes no Streamlit calls, so it can run on the background save thread.
+    
+    Raises:
+        Exception: Any database error; the transaction is rolled back
     """
-    try:
-        db_path = get_database_path()
-        conn = sqlite3.connect(db_path)
-        
+    with db_transaction() as conn:
         # Clear existing data
         cursor = conn.cursor()
         cursor.execute('DELETE FROM application_data')
         
-        # Insert new data
-        for _, row in df.iterrows():
-            cursor.execute('''
+        # Insert new data in chunks so only one chunk at a time is held as
+        # Python objects; missing columns and values are stored as ''
+        db_columns = df.reindex(columns=list(DB_APPLICATION_COLUMNS))
+        for start in range(0, len(db_columns), DB_INSERT_CHUNK_SIZE):
+            rows = db_columns.iloc[start:start + DB_INSERT_CHUNK_SIZE].astype(object).fillna('')
+            cursor.executemany('''
                 INSERT INTO application_data 
                 (instance_id, instance_name, app_name, app_type, app_status, app_image, ports)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                row.get('instance_id', ''),
-                row.get('instance_name', ''),
-                row.get('app_name', ''),
-                row.get('app_type', ''),
-                row.get('app_status', ''),
-                row.get('app_image', ''),
-                row.get('ports', '')
-            ))
-        
-        conn.commit()
-        conn.close()
-        logger.info(f"Successfully saved {len(df)} records to database")
+            ''', rows.itertuples(index=False, name=None))
+    read_application_data.clear()
+    logger.info(f"Successfully saved {len(df)} records to database")
+
+@st.cache_resource
+def get_save_executor() -> ThreadPoolExecutor:
+    """
+    Single worker thread that runs background database saves one at a time
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-save')
+
+def save_data_to_db(df: pd.DataFrame):
+    """
+    Save DataFrame to SQLite database
+    """
+    try:
+        write_application_data(df)
         return True
     except Exception as e:
         error_msg = f"Error saving to database: {str(e)}"
@@ -1261,42 +1710,59 @@ def save_data_to_db(df: pd.DataFrame):
         st.error(error_msg)
         return False
 
+def format_json_port_lists(values: List[str]) -> List[str]:
+    """
+    Turn JSON-encoded port lists into comma-separated strings.
+    
+    The values are parsed in a single call; if any of them is malformed they
+    are parsed one by one and the bad entries become ''.
+    """
+    try:
+        parsed = json_loads('[' + ','.join(values) + ']')
+    except ValueError:
+        parsed = None
+    # A value such as "[80], [443]" still parses in bulk but shifts the items
+    if parsed is None or len(parsed) != len(values) or not all(isinstance(item, list) for item in parsed):
+        parsed = []
+        for value in values:
+            try:
+                ports_list = json_loads(value)
+            except ValueError:
+                ports_list = None
+            parsed.append(ports_list if isinstance(ports_list, list) else None)
+    return [', '.join(map(str, ports_list)) if ports_list is not None else '' for ports_list in parsed]
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def read_application_data() -> pd.DataFrame:
+    """
+    Read application_data into an Arrow-backed DataFrame with ports normalised
+    to comma-separated strings
+    """
+    with db_transaction() as conn:
+        df = pd.read_sql_query(
+            f"SELECT {', '.join(DB_APPLICATION_COLUMNS)} FROM application_data",
+            conn,
+            dtype_backend='pyarrow'
+        )
+    
+    # Ports were stored either as JSON lists or as comma-separated strings
+    if not df.empty:
+        ports = df['ports'].fillna('')
+        ports = ports.mask(ports.isin(['nan', 'None']), '')
+        is_json = ports.str.startswith('[') & ports.str.endswith(']')
+        if is_json.any():
+            ports[is_json] = format_json_port_lists(ports[is_json].tolist())
+        df['ports'] = ports
+    
+    # Same categorical columns as freshly uploaded data
+    return df.astype({col: 'category' for col in CATEGORICAL_COLUMNS if col in df.columns})
+
 def load_data_from_db() -> pd.DataFrame:
     """
     Load DataFrame from SQLite database
     """
     try:
-        db_path = get_database_path()
-        if not os.path.exists(db_path):
-            return pd.DataFrame()
-        
-        conn = sqlite3.connect(db_path)
-        df = pd.read_sql_query('SELECT * FROM application_data', conn)
-        conn.close()
-        
-        # Convert ports back to list if needed
-        if not df.empty and 'ports' in df.columns:
-            def safe_convert_ports(x):
-                if not x or x == 'nan' or x == 'None':
-                    return ''
-                try:
-                    # Try to parse as JSON first
-                    if isinstance(x, str):
-                        if x.startswith('[') and x.endswith(']'):
-                            ports_list = json.loads(x)
-                            return ', '.join(map(str, ports_list))
-                        else:
-                            # Already comma-separated string, return as-is
-                            return x
-                    elif isinstance(x, list):
-                        return ', '.join(map(str, x))
-                    else:
-                        return str(x)
-                except:
-                    return ''
-            
-            df['ports'] = df['ports'].apply(safe_convert_ports)
-        
+        df = read_application_data()
         logger.info(f"Successfully loaded {len(df)} records from database")
         return df
     except Exception as e:
@@ -1310,15 +1776,12 @@ def clear_database():
     Clear all data from the database
     """
     try:
-        db_path = get_database_path()
-        if os.path.exists(db_path):
-            conn = sqlite3.connect(db_path)
+        with db_transaction() as conn:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM application_data')
             cursor.execute('DELETE FROM user_tables')
-            conn.commit()
-            conn.close()
-            return True
+        read_application_data.clear()
+        return True
     except Exception as e:
         st.error(f"Error clearing database: {str(e)}")
         return False
@@ -1328,25 +1791,13 @@ def save_user_table_to_db(table_name: str, columns: list, filters: dict, custom_
     Save user table configuration to database
     """
     try:
-        db_path = get_database_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Update table schema to include custom_columns if it doesn't exist
-        cursor.execute("PRAGMA table_info(user_tables)")
-        columns_info = cursor.fetchall()
-        column_names = [col[1] for col in columns_info]
-        
-        if 'custom_columns' not in column_names:
-            cursor.execute('ALTER TABLE user_tables ADD COLUMN custom_columns TEXT DEFAULT "{}"')
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO user_tables (table_name, columns, filters, custom_columns)
-            VALUES (?, ?, ?, ?)
-        ''', (table_name, json.dumps(columns), json.dumps(filters), json.dumps(custom_columns or {})))
+        with db_transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO user_tables (table_name, columns, filters, custom_columns)
+                VALUES (?, ?, ?, ?)
+            ''', (table_name, json_dumps(columns), json_dumps(filters), json_dumps(custom_columns or {})))
         
-        conn.commit()
-        conn.close()
         return True
     except Exception as e:
         st.error(f"Error saving user table: {str(e)}")
@@ -1357,45 +1808,20 @@ def load_user_tables_from_db() -> dict:
     Load user table configurations from database
     """
     try:
-        db_path = get_database_path()
-        if not os.path.exists(db_path):
-            return {}
-        
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Check if custom_columns column exists
-        cursor.execute("PRAGMA table_info(user_tables)")
-        columns_info = cursor.fetchall()
-        column_names = [col[1] for col in columns_info]
-        
-        if 'custom_columns' in column_names:
+        with db_transaction() as conn:
+            cursor = conn.cursor()
             cursor.execute('SELECT table_name, columns, filters, custom_columns, created_at FROM user_tables')
             rows = cursor.fetchall()
-            
-            user_tables = {}
-            for row in rows:
-                user_tables[row[0]] = {
-                    'columns': json.loads(row[1]),
-                    'filters': json.loads(row[2]),
-                    'custom_columns': json.loads(row[3]) if row[3] else {},
-                    'created_at': row[4]
-                }
-        else:
-            # Fallback for older database schema
-            cursor.execute('SELECT table_name, columns, filters, created_at FROM user_tables')
-            rows = cursor.fetchall()
-            
-            user_tables = {}
-            for row in rows:
-                user_tables[row[0]] = {
-                    'columns': json.loads(row[1]),
-                    'filters': json.loads(row[2]),
-                    'custom_columns': {},
-                    'created_at': row[3]
-                }
         
-        conn.close()
+        user_tables = {}
+        for row in rows:
+            user_tables[row[0]] = {
+                'columns': json_loads(row[1]),
+                'filters': json_loads(row[2]),
+                'custom_columns': json_loads(row[3]) if row[3] else {},
+                'created_at': row[4]
+            }
+        
         return user_tables
     except Exception as e:
         st.error(f"Error loading user tables: {str(e)}")
@@ -1406,105 +1832,229 @@ def delete_user_table_from_db(table_name: str):
     Delete a specific user table from database
     """
     try:
-        db_path = get_database_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM user_tables WHERE table_name = ?', (table_name,))
+        with db_transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM user_tables WHERE table_name = ?', (table_name,))
         
-        conn.commit()
-        conn.close()
         return True
     except Exception as e:
         st.error(f"Error deleting user table: {str(e)}")
         return False
 
+# Custom tables with at least this many rows are stored as zstd-compressed
+# Parquet; smaller ones as an uncompressed Arrow IPC stream
+PARQUET_MIN_ROWS = 100
+
+def encode_table_columns(columns: list, column_data: list) -> Optional[bytes]:
+    """
+    Serialize custom table columns as Parquet or an Arrow IPC stream.
+    
+    Args:
+        columns: Column names of the table
+        column_data: One list of values per column
+        
+    Returns:
+        Parquet or IPC stream bytes, or None if the values cannot be stored as
+        typed columns (no columns, columns of different lengths or mixed value
+        types within a column)
+    """
+    if not columns or len(column_data) != len(columns) or len({len(values) for values in column_data}) > 1:
+        return None
+    
+    # Arrow would coerce e.g. [1, 2.5] to doubles, so mixed columns stay in JSON
+    if any(len({type(value) for value in values if value is not None}) > 1 for values in column_data):
+        return None
+    
+    try:
+        arrays = [pa.array(values, from_pandas=True) for values in column_data]
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return None
+    
+    names = [str(col) for col in columns]
+    table = pa.Table.from_arrays(arrays, names=names)
+    sink = pa.BufferOutputStream()
+    # Parquet cannot round-trip duplicate column names
+    if table.num_rows >= PARQUET_MIN_ROWS and len(set(names)) == len(names):
+        pq.write_table(table, sink, compression='zstd', use_dictionary=True)
+    else:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def decode_table_columns(blob: bytes) -> list:
+    """
+    Read custom table columns back from a Parquet or Arrow IPC blob as one list per column
+    """
+    if blob[:4] == b'PAR1':
+        table = pq.read_table(pa.BufferReader(blob))
+    else:
+        table = pa.ipc.open_stream(blob).read_all()
+    return [column.to_pylist() for column in table.columns]
+
 def save_custom_table_to_db(table_name: str, table_data: dict):
     """
     Save custom editable table to database
     """
     try:
-        db_path = get_database_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        # Values go into an Arrow blob and only the metadata into JSON; tables
+        # that cannot be stored that way keep their values in the JSON
+        table_rows = encode_table_columns(table_data.get('columns', []), table_data.get('column_data', []))
+        if table_rows is not None:
+            metadata = {key: value for key, value in table_data.items() if key != 'column_data'}
+        else:
+            metadata = table_data
         
-        # Create custom_tables table if it doesn't exist
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS custom_tables (
-                table_name TEXT PRIMARY KEY,
-                table_data TEXT,
-                created_at TEXT,
-                updated_at TEXT
-            )
-        ''')
+        with db_transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Insert or update table data
+            cursor.execute('''
+                INSERT OR REPLACE INTO custom_tables (table_name, table_data, created_at, updated_at, table_rows)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (
+                table_name,
+                json_dumps(metadata),
+                table_data.get('created_at', datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                table_rows
+            ))
         
-        # Insert or update table data
-        cursor.execute('''
-            INSERT OR REPLACE INTO custom_tables (table_name, table_data, created_at, updated_at)
-            VALUES (?, ?, ?, ?)
-        ''', (
-            table_name,
-            json.dumps(table_data),
-            table_data.get('created_at', datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ))
-        
-        conn.commit()
-        conn.close()
         return True
     except Exception as e:
         st.error(f"Error saving custom table: {str(e)}")
         return False
 
-def load_custom_tables_from_db() -> dict:
+def load_custom_table_names_from_db() -> list:
     """
-    Load custom editable tables from database
+    Load the names of the saved custom tables without their contents
     """
     try:
-        db_path = get_database_path()
-        if not os.path.exists(db_path):
-            return {}
-        
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        with db_transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT table_name FROM custom_tables')
+            rows = cursor.fetchall()
         
-        # Check if custom_tables table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='custom_tables'")
-        if not cursor.fetchone():
-            conn.close()
-            return {}
+        return [row[0] for row in rows]
+    except Exception as e:
+        st.error(f"Error loading custom tables: {str(e)}")
+        return []
+
+def load_custom_table_from_db(table_name: str) -> Optional[dict]:
+    """
+    Load a single custom editable table from database
+    """
+    try:
+        with db_transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT table_data, table_rows FROM custom_tables WHERE table_name = ?', (table_name,))
+            row = cursor.fetchone()
         
-        cursor.execute('SELECT table_name, table_data FROM custom_tables')
-        rows = cursor.fetchall()
+        if row is None:
+            return None
         
-        custom_tables = {}
-        for row in rows:
-            custom_tables[row[0]] = json.loads(row[1])
+        table_data = json_loads(row[0])
+        if row[1] is not None:
+            table_data['column_data'] = decode_table_columns(row[1])
+        elif 'data' in table_data:
+            # Tables saved before column storage hold a list of rows
+            rows_data = table_data.pop('data')
+            table_data['column_data'] = [list(values) for values in zip(*rows_data)] if rows_data else [[] for _ in table_data['columns']]
         
-        conn.close()
-        return custom_tables
+        return table_data
     except Exception as e:
-        st.error(f"Error loading custom tables: {str(e)}")
-        return {}
+        st.error(f"Error loading custom table: {str(e)}")
+        return None
 
 def delete_custom_table_from_db(table_name: str):
     """
     Delete a custom table from database
     """
     try:
-        db_path = get_database_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM custom_tables WHERE table_name = ?', (table_name,))
+        with db_transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM custom_tables WHERE table_name = ?', (table_name,))
         
-        conn.commit()
-        conn.close()
         return True
     except Exception as e:
         st.error(f"Error deleting custom table: {str(e)}")
         return False
 
+def build_table_frame(table_data: dict) -> pd.DataFrame:
+    """
+    Build the editor DataFrame of a custom table from its per-column value lists
+    """
+    frame = pd.DataFrame(dict(enumerate(table_data['column_data'])))
+    # Positional keys above keep duplicate column names apart
+    frame.columns = table_data['columns']
+    return frame
+
+def filter_template_rows(df: pd.DataFrame, data_version: str, selected_types: tuple, selected_instances: tuple) -> pd.DataFrame:
+    """
+    Select the application rows kept by the template filters.
+    
+    Only the latest result is kept, in session state under the data version
+    token and the selections, so an unchanged filter is not recomputed on
+    rerun and superseded results are released.
+    
+    Args:
+        df: Processed DataFrame
+        data_version: Token identifying df, see set_processed_data
+        selected_types: App types to keep; empty keeps all
+        selected_instances: Instance names to keep; empty keeps all
+        
+    Returns:
+        Filtered DataFrame
+    """
+    cache_key = (data_version, selected_types, selected_instances)
+    cached = st.session_state.get('template_filter_cache')
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+    
+    mask = np.ones(len(df), dtype=bool)
+    if selected_types and 'app_type' in df.columns:
+        mask &= df['app_type'].isin(selected_types).to_numpy()
+    if selected_instances and 'instance_name' in df.columns:
+        mask &= df['instance_name'].isin(selected_instances).to_numpy()
+    filtered_df = df[mask]
+    st.session_state.template_filter_cache = (cache_key, filtered_df)
+    return filtered_df
+
+def open_custom_table(table_name: str):
+    """
+    Load a custom table into the editor, discarding any unsaved edits
+    """
+    # Contents of saved tables are only read from the database when first opened
+    if st.session_state.custom_tables.get(table_name) is None:
+        table_data = load_custom_table_from_db(table_name)
+        if table_data is None:
+            return
+        st.session_state.custom_tables[table_name] = table_data
+    
+    st.session_state.current_custom_table = table_name
+    st.session_state.editing_table_data = st.session_state.custom_tables[table_name]
+    st.session_state.editing_table_frame = None
+    st.session_state.editing_table_dirty = False
+    # A new editor key starts the data editor without the previous edits; it is
+    # unique across sessions so it can also key cached exports
+    st.session_state.editor_version = uuid.uuid4().hex
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=16)
+def export_edited_table(_df: pd.DataFrame, edit_key: str, file_format: str) -> bytes:
+    """
+    Download payload for the custom table being edited.
+    
+    Args:
+        _df: Current editor output (not hashed)
+        edit_key: Editor key plus its pending edits, which identify _df
+        file_format: 'csv' or 'json'
+        
+    Returns:
+        Encoded file contents
+    """
+    if file_format == 'csv':
+        return dataframe_to_csv(_df)
+    return dataframe_to_json(_df)
+
 def create_custom_editable_tables():
     """
     Create Google Sheets-like editable custom tables
@@ -1514,11 +2064,21 @@ def create_custom_editable_tables():
     
     # Initialize session state for custom tables
     if 'custom_tables' not in st.session_state:
-        st.session_state.custom_tables = load_custom_tables_from_db()
+        # Table contents are loaded lazily by open_custom_table
+        st.session_state.custom_tables = dict.fromkeys(load_custom_table_names_from_db())
+    if 'saved_custom_tables' not in st.session_state:
+        # Names whose current session version is known to match the database
+        st.session_state.saved_custom_tables = set(st.session_state.custom_tables)
     if 'current_custom_table' not in st.session_state:
         st.session_state.current_custom_table = None
     if 'editing_table_data' not in st.session_state:
         st.session_state.editing_table_data = None
+    if 'editing_table_frame' not in st.session_state:
+        st.session_state.editing_table_frame = None
+    if 'editing_table_dirty' not in st.session_state:
+        st.session_state.editing_table_dirty = False
+    if 'editor_version' not in st.session_state:
+        st.session_state.editor_version = uuid.uuid4().hex
     
     # Sidebar for table management
     with st.sidebar:
@@ -1552,16 +2112,18 @@ def create_custom_editable_tables():
                 # Create empty table structure
                 table_data = {
                     'columns': columns,
-                    'data': [["" for _ in columns] for _ in range(row_count)],
+                    'column_data': np.full((len(columns), row_count), "", dtype=object).tolist(),
                     'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 }
                 
                 st.session_state.custom_tables[new_table_name] = table_data
-                st.session_state.current_custom_table = new_table_name
-                st.session_state.editing_table_data = table_data.copy()
+                open_custom_table(new_table_name)
                 
                 if save_custom_table_to_db(new_table_name, table_data):
+                    st.session_state.saved_custom_tables.add(new_table_name)
                     st.success(f"Table '{new_table_name}' created successfully!")
+                else:
+                    st.session_state.saved_custom_tables.discard(new_table_name)
                 st.rerun()
         
         with create_tab2:
@@ -1585,8 +2147,8 @@ def create_custom_editable_tables():
                         if 'app_type' in app_df.columns:
                             selected_types = st.multiselect(
                                 "App Types:", 
-                                options=app_df['app_type'].unique().tolist(),
-                                default=app_df['app_type'].unique().tolist()
+                                options=list(get_unique_values(app_df, st.session_state.processed_data_version, 'app_type')),
+                                default=list(get_unique_values(app_df, st.session_state.processed_data_version, 'app_type'))
                             )
                         else:
                             selected_types = []
@@ -1595,20 +2157,21 @@ def create_custom_editable_tables():
                         if 'instance_name' in app_df.columns:
                             selected_instances = st.multiselect(
                                 "Instances:", 
-                                options=app_df['instance_name'].unique().tolist(),
-                                default=app_df['instance_name'].unique().tolist()[:5]  # Limit default selection
+                                options=list(get_unique_values(app_df, st.session_state.processed_data_version, 'instance_name')),
+                                default=list(get_unique_values(app_df, st.session_state.processed_data_version, 'instance_name'))[:5]  # Limit default selection
                             )
                         else:
                             selected_instances = []
                     
                     # Apply filters
-                    filtered_df = app_df.copy()
-                    if selected_types and 'app_type' in app_df.columns:
-                        filtered_df = filtered_df[filtered_df['app_type'].isin(selected_types)]
-                    if selected_instances and 'instance_name' in app_df.columns:
-                        filtered_df = filtered_df[filtered_df['instance_name'].isin(selected_instances)]
+                    filtered_df = filter_template_rows(
+                        app_df,
+                        st.session_state.processed_data_version,
+                        tuple(selected_types),
+                        tuple(selected_instances)
+                    )
                 else:
-                    filtered_df = app_df.copy()
+                    filtered_df = app_df
                 
                 # Select columns to include
                 st.markdown("**Select Columns:**")
@@ -1636,41 +2199,44 @@ def create_custom_editable_tables():
                     if custom_col_name:
                         custom_columns.append(custom_col_name)
                 
+                # Custom names that repeat or match a selected column are dropped,
+                # so the preview, the column count and the created table agree
+                new_columns = [col for col in dict.fromkeys(custom_columns) if col not in selected_columns]
+                
                 # Preview the template
                 if selected_columns:
-                    preview_df = filtered_df[selected_columns].head(3)
+                    # Take the preview rows before projecting so only three rows are copied
+                    preview_df = filtered_df.head(3)[selected_columns]
                     
                     # Add custom columns to preview
-                    for custom_col in custom_columns:
-                        preview_df[custom_col] = ""
+                    preview_df = preview_df.assign(**{custom_col: "" for custom_col in new_columns})
                     
                     st.markdown("**Preview:**")
                     st.dataframe(preview_df, use_container_width=True)
                     
-                    st.info(f"Template will include {len(filtered_df)} rows and {len(selected_columns) + len(custom_columns)} columns")
+                    st.info(f"Template will include {len(filtered_df)} rows and {len(selected_columns) + len(new_columns)} columns")
                 
                 if st.button("📋 Create from Template", disabled=not template_table_name or not selected_columns):
-                    # Create table from template
-                    template_df = filtered_df[selected_columns].copy()
-                    
-                    # Add custom columns
-                    for custom_col in custom_columns:
-                        template_df[custom_col] = ""
+                    # Create table from template: read each selected column straight
+                    # into the stored per-column lists, with no intermediate frame
+                    row_count = len(filtered_df)
                     
                     # Convert to table data format
                     table_data = {
-                        'columns': template_df.columns.tolist(),
-                        'data': template_df.values.tolist(),
+                        'columns': list(selected_columns) + new_columns,
+                        'column_data': [filtered_df[col].tolist() for col in selected_columns] + [[""] * row_count for _ in new_columns],
                         'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                         'template_source': 'application_data'
                     }
                     
                     st.session_state.custom_tables[template_table_name] = table_data
-                    st.session_state.current_custom_table = template_table_name
-                    st.session_state.editing_table_data = table_data.copy()
+                    open_custom_table(template_table_name)
                     
                     if save_custom_table_to_db(template_table_name, table_data):
-                        st.success(f"Table '{template_table_name}' created from template with {len(template_df)} rows!")
+                        st.session_state.saved_custom_tables.add(template_table_name)
+                        st.success(f"Table '{template_table_name}' created from template with {row_count} rows!")
+                    else:
+                        st.session_state.saved_custom_tables.discard(template_table_name)
                     st.rerun()
             else:
                 st.info("📊 No application data available. Upload data first or load from database to create templates.")
@@ -1678,8 +2244,7 @@ def create_custom_editable_tables():
                 if st.button("🔄 Load Data from Database"):
                     db_data = load_data_from_db()
                     if not db_data.empty:
-                        st.session_state.processed_data = db_data
-                        st.session_state.data_loaded = True
+                        set_processed_data(db_data)
                         st.success(f"Loaded {len(db_data)} records from database")
                         st.rerun()
                     else:
@@ -1694,12 +2259,12 @@ def create_custom_editable_tables():
                 col_load, col_delete = st.columns([2, 1])
                 with col_load:
                     if st.button(f"📝 {table_name}", key=f"load_custom_{table_name}"):
-                        st.session_state.current_custom_table = table_name
-                        st.session_state.editing_table_data = st.session_state.custom_tables[table_name].copy()
+                        open_custom_table(table_name)
                         st.rerun()
                 with col_delete:
                     if st.button("🗑️", key=f"delete_custom_{table_name}"):
                         del st.session_state.custom_tables[table_name]
+                        st.session_state.saved_custom_tables.discard(table_name)
                         if delete_custom_table_from_db(table_name):
                             st.success(f"Table '{table_name}' deleted!")
                         if st.session_state.current_custom_table == table_name:
@@ -1716,51 +2281,75 @@ def create_custom_editable_tables():
         
         st.markdown(f"### 📝 Editing: {table_name}")
         
-        # Table controls
-        col_controls1, col_controls2, col_controls3 = st.columns([1, 1, 1])
+        notice = st.session_state.pop('custom_table_notice', None)
+        if notice:
+            st.success(notice)
+        
+        # Table controls; Save acts on the editor output below. Rows are added
+        # directly in the editor, which has dynamic rows enabled
+        col_controls1, col_controls2 = st.columns([1, 1])
         
         with col_controls1:
-            if st.button("➕ Add Row"):
-                table_data['data'].append(["" for _ in table_data['columns']])
-                st.rerun()
+            save_clicked = st.button("💾 Save Changes")
         
         with col_controls2:
-            if st.button("💾 Save Changes"):
-                st.session_state.custom_tables[table_name] = table_data.copy()
-                if save_custom_table_to_db(table_name, table_data):
-                    st.success("Changes saved successfully!")
-                else:
-                    st.error("Failed to save changes")
-        
-        with col_controls3:
             if st.button("🔄 Reset Changes"):
-                st.session_state.editing_table_data = st.session_state.custom_tables[table_name].copy()
+                open_custom_table(table_name)
                 st.rerun()
         
         # Editable table interface
         st.markdown("#### 📊 Table Data")
         
-        # Create DataFrame for editing
-        df_data = pd.DataFrame(table_data['data'], columns=table_data['columns'])
+        # The editor input is built once per opened table and kept stable;
+        # st.data_editor holds the user's edits on top of it until they are saved
+        if st.session_state.editing_table_frame is None:
+            st.session_state.editing_table_frame = build_table_frame(table_data)
+        df_data = st.session_state.editing_table_frame
         
         # Use st.data_editor for editable table
+        editor_key = f"editor_{table_name}_{st.session_state.editor_version}"
         edited_df = st.data_editor(
             df_data,
             use_container_width=True,
             num_rows="dynamic",
-            key=f"editor_{table_name}"
+            key=editor_key
         )
         
-        # Update session state with edited data
-        if not edited_df.equals(df_data):
-            st.session_state.editing_table_data['data'] = edited_df.values.tolist()
+        # The editor reports its own diff, so there is no need to compare every cell
+        editor_state = st.session_state.get(editor_key, {})
+        if editor_state.get('edited_rows') or editor_state.get('added_rows') or editor_state.get('deleted_rows'):
+            st.session_state.editing_table_dirty = True
         
-        # Export options
+        if save_clicked:
+            if not st.session_state.editing_table_dirty and table_name in st.session_state.saved_custom_tables:
+                # Nothing changed since the table was last loaded or written
+                with col_controls1:
+                    st.info("No changes to save")
+            else:
+                if st.session_state.editing_table_dirty:
+                    # Columns are only converted back to lists when the table is saved
+                    table_data = {
+                        **table_data,
+                        'columns': edited_df.columns.tolist(),
+                        'column_data': [edited_df.iloc[:, i].tolist() for i in range(edited_df.shape[1])]
+                    }
+                if save_custom_table_to_db(table_name, table_data):
+                    st.session_state.custom_tables[table_name] = table_data
+                    st.session_state.saved_custom_tables.add(table_name)
+                    open_custom_table(table_name)
+                    st.session_state.custom_table_notice = "Changes saved successfully!"
+                    st.rerun()
+                else:
+                    st.error("Failed to save changes")
+        
+        # Export options; payloads are keyed by the editor state rather than by
+        # hashing the whole table on every rerun
         st.markdown("#### 📤 Export Options")
         export_col1, export_col2 = st.columns(2)
+        edit_key = editor_key + json_dumps(dict(editor_state))
         
         with export_col1:
-            csv_data = edited_df.to_csv(index=False)
+            csv_data = export_edited_table(edited_df, edit_key, 'csv')
             st.download_button(
                 label="📄 Download as CSV",
                 data=csv_data,
@@ -1770,7 +2359,7 @@ def create_custom_editable_tables():
             )
         
         with export_col2:
-            json_data = edited_df.to_json(orient='records', indent=2)
+            json_data = export_edited_table(edited_df, edit_key, 'json')
             st.download_button(
                 label="📋 Download as JSON",
                 data=json_data,
@@ -1821,6 +2410,7 @@ def main():
     
     # Show error notification if any
     show_error_notification()
+    show_auto_save_status()
     
     # Navigation bar
     create_navigation_bar()
@@ -1833,8 +2423,7 @@ def main():
             if st.button("🔄 Load from Database"):
                 db_data = load_data_from_db()
                 if not db_data.empty:
-                    st.session_state.processed_data = db_data
-                    st.session_state.data_loaded = True
+                    set_processed_data(db_data)
                     st.success(f"Loaded {len(db_data)} records from database")
                     st.rerun()
                 else:
@@ -1874,8 +2463,7 @@ def main():
     if not st.session_state.data_loaded and 'processed_data' not in st.session_state:
         db_data = load_data_from_db()
         if not db_data.empty:
-            st.session_state.processed_data = db_data
-            st.session_state.data_loaded = True
+            set_processed_data(db_data)
             st.info(f"Auto-loaded {len(db_data)} records from database")
     
     # File upload section (always visible)
@@ -1905,14 +2493,11 @@ def main():
                 st.success(f"✅ Successfully processed {len(uploaded_files)} files in {processing_time:.2f} seconds")
                 
                 # Store in session state and mark as loaded
-                st.session_state.processed_data = combined_df
-                st.session_state.data_loaded = True
+                set_processed_data(combined_df)
                 
-                # Auto-save to database
-                if save_data_to_db(combined_df):
-                    st.success("📊 Data automatically saved to database")
-                else:
-                    st.warning("⚠️ Failed to save data to database")
+                # Auto-save to database in the background so the dashboard
+                # renders without waiting for the write
+                st.session_state.auto_save_future = get_save_executor().submit(write_application_data, combined_df)
                 
                 st.rerun()
             else: